@@ -0,0 +1,407 @@
+"""
+Unit tests for structured_extraction_v2 helpers.
+
+Covers the keyword search (checked against the original paragraph-by-paragraph
+implementation), prompt budget helpers, bundled-reply splitting, event
+de-duplication and per-thread log capture.
+"""
+
+import io
+import os
+import random
+import re
+from datetime import date
+
+import pytest
+
+# The module builds its OpenAI client at import time; no request is ever sent
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from src.structured_extraction_v2 import (
+    BlogPost,
+    CompanyLogStdout,
+    Event,
+    allocate_char_budget,
+    dedupe_events,
+    get_source_index,
+    pending_llm_sections,
+    run_side_by_side,
+    search_all_sources,
+    split_llm_bundle,
+    truncate_lines,
+)
+
+
+# ============================================================================
+# Reference search (the original implementation, kept verbatim in behaviour)
+# ============================================================================
+
+def reference_search_html(sources, keywords, max_chars):
+    from bs4 import BeautifulSoup
+
+    relevant_content = []
+    total_chars = 0
+    for file_name, file_data in sources.get('html_files', {}).items():
+        if total_chars >= max_chars:
+            break
+        try:
+            soup = BeautifulSoup(file_data['content'], 'lxml')
+            for tag in soup(['script', 'style', 'nav', 'footer', 'header']):
+                tag.decompose()
+            for para in soup.find_all(['p', 'div', 'section', 'article']):
+                text = para.get_text().strip()
+                if not text or len(text) < 50:
+                    continue
+                text_lower = text.lower()
+                if any(kw.lower() in text_lower for kw in keywords):
+                    snippet = ' '.join(text.split()[:200])
+                    relevant_content.append(f"[{file_name.upper()} HTML]\n{snippet}\n")
+                    total_chars += len(snippet)
+                    if total_chars >= max_chars:
+                        break
+        except Exception:
+            continue
+    return '\n---\n'.join(relevant_content)
+
+
+def reference_search(sources, keywords, max_chars=5000):
+    relevant_content = []
+    total_chars = 0
+
+    for file_name, file_data in sources.get('files', {}).items():
+        if total_chars >= max_chars:
+            break
+        for para in re.split(r'\n\s*\n', file_data['content']):
+            para_lower = para.lower()
+            if any(kw.lower() in para_lower for kw in keywords):
+                snippet = para.strip()
+                relevant_content.append(f"[{file_name.upper()}]\n{snippet}\n")
+                total_chars += len(snippet)
+                if total_chars >= max_chars:
+                    break
+
+    if total_chars < max_chars:
+        html_content = reference_search_html(sources, keywords, max_chars - total_chars)
+        if html_content:
+            relevant_content.append(html_content)
+            total_chars += len(html_content)
+
+    if total_chars < max_chars:
+        for blog in sources.get('blog_posts', [])[:10]:
+            if total_chars >= max_chars:
+                break
+            for para in re.split(r'\n\s*\n', blog.content):
+                para_lower = para.lower()
+                if any(kw.lower() in para_lower for kw in keywords):
+                    snippet = para.strip()
+                    relevant_content.append(f"[BLOG: {blog.id}]\n{snippet}\n")
+                    total_chars += len(snippet)
+                    if total_chars >= max_chars:
+                        break
+
+    return '\n---\n'.join(relevant_content)
+
+
+WORDS = ['Acme', 'raised', 'Series', 'funding', 'round', 'CEO', 'founder', 'product',
+         'platform', 'launch', 'office', 'London', 'the', 'and', 'with', 'İstanbul', 'team']
+SEPARATORS = ['\n\n', '\n\n\n', '\n  \n', '\n\t\n\n', '\n']
+KEYWORD_SETS = [
+    ['funding', 'raised', 'Series'],
+    ['CEO', 'Founder'],
+    ['launch', 'PRODUCT', 'platform'],
+    ['office', 'london'],
+    ['nothing-matches'],
+]
+
+
+def random_text(rng, paragraphs):
+    parts = []
+    for _ in range(paragraphs):
+        parts.append(' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 30))))
+        parts.append(rng.choice(SEPARATORS))
+    return ''.join(parts)
+
+
+def random_html(rng):
+    blocks = []
+    for _ in range(rng.randint(1, 6)):
+        text = random_text(rng, 1).strip()
+        blocks.append(rng.choice([
+            f"<p>{text}</p>",
+            f"<div><p>{text}</p>\n  <span>{text}</span></div>",
+            f"<section><article>{text}</article></section>",
+            f"<nav><p>{text}</p></nav>",
+            f"<script>var x = '{text}';</script>",
+        ]))
+    return f"<html><head><title>t</title></head><body>{''.join(blocks)}</body></html>"
+
+
+def random_sources(rng):
+    return {
+        'files': {f"page{i}": {'content': random_text(rng, rng.randint(0, 8))}
+                  for i in range(rng.randint(0, 4))},
+        'html_files': {f"html{i}": {'content': random_html(rng)} for i in range(rng.randint(0, 3))},
+        'blog_posts': [BlogPost(id=f"post-{i}", content=random_text(rng, rng.randint(1, 5)),
+                                path=f"blog_post-{i}_clean.txt", size=0)
+                       for i in range(rng.randint(0, 12))],
+    }
+
+
+class TestSearchAllSources:
+    """search_all_sources / SourceIndex must return exactly what the original search did."""
+
+    def test_matches_reference_search(self):
+        pytest.importorskip("bs4")
+        rng = random.Random(1234)
+        for _ in range(150):
+            sources = random_sources(rng)
+            for keywords in KEYWORD_SETS:
+                max_chars = rng.choice([50, 300, 2000, 5000])
+                assert search_all_sources(sources, keywords, max_chars) == reference_search(sources, keywords, max_chars)
+
+    def test_multi_search_matches_separate_searches(self):
+        pytest.importorskip("bs4")
+        rng = random.Random(99)
+        for _ in range(100):
+            sources = random_sources(rng)
+            groups = {f"g{i}": (keywords, rng.choice([80, 600, 4000]))
+                      for i, keywords in enumerate(KEYWORD_SETS)}
+            results = get_source_index(sources).multi_search(groups)
+            for name, (keywords, max_chars) in groups.items():
+                assert results[name] == reference_search(sources, keywords, max_chars)
+
+    def test_index_rebuilt_when_sources_change(self):
+        sources = {'files': {'about': {'content': 'We raised a Series A.'}}, 'html_files': {}, 'blog_posts': []}
+        assert 'Series A' in search_all_sources(sources, ['raised'])
+        sources['files']['team'] = {'content': 'Our CEO founded the company.'}
+        assert 'CEO' in search_all_sources(sources, ['ceo'])
+
+
+# ============================================================================
+# Prompt budget helpers
+# ============================================================================
+
+class TestAllocateCharBudget:
+    """allocate_char_budget splits a prompt budget across sections by weight."""
+
+    def test_even_split_without_limits(self):
+        assert allocate_char_budget(100, {'a': 1, 'b': 1}) == {'a': 50, 'b': 50}
+
+    def test_split_follows_weights(self):
+        assert allocate_char_budget(100, {'a': 3, 'b': 1}) == {'a': 75, 'b': 25}
+
+    def test_unused_share_goes_to_other_sections(self):
+        assert allocate_char_budget(100, {'a': 1, 'b': 1}, {'a': 10}) == {'a': 10, 'b': 90}
+
+    def test_never_exceeds_available_content(self):
+        assert allocate_char_budget(100, {'a': 1, 'b': 1}, {'a': 10, 'b': 20}) == {'a': 10, 'b': 20}
+
+    def test_empty_sections_get_nothing(self):
+        assert allocate_char_budget(100, {'a': 1, 'b': 1}, {'a': 0}) == {'a': 0, 'b': 100}
+
+    def test_total_and_limits_respected(self):
+        rng = random.Random(7)
+        for _ in range(500):
+            weights = {name: rng.randint(1, 5) for name in 'abcd'[:rng.randint(1, 4)]}
+            available = {name: rng.randint(0, 3000) for name in weights if rng.random() < 0.7}
+            total = rng.randint(0, 8000)
+            budgets = allocate_char_budget(total, weights, available)
+            assert set(budgets) == set(weights)
+            assert sum(budgets.values()) <= total
+            for name, budget in budgets.items():
+                assert 0 <= budget <= available.get(name, total)
+
+
+class TestTruncateLines:
+    """truncate_lines cuts text on a line boundary when it can."""
+
+    def test_short_text_unchanged(self):
+        assert truncate_lines("abc\ndef", 7) == "abc\ndef"
+
+    def test_cuts_at_last_line_break(self):
+        assert truncate_lines("abc\ndef\nghi", 9) == "abc\ndef"
+        assert truncate_lines("ab\ncd", 2) == "ab"
+
+    def test_hard_cut_without_line_break(self):
+        assert truncate_lines("abcdef", 3) == "abc"
+        assert truncate_lines("\nabcdef", 3) == "\nab"
+
+
+# ============================================================================
+# Bundled LLM replies and event de-duplication
+# ============================================================================
+
+BUNDLE_SECTIONS = {
+    'funding': ('funding ctx', 'funding prompt'),
+    'leadership': ('leadership ctx', 'leadership prompt'),
+    'products': ('products ctx', 'products prompt'),
+    'other_events': (None, 'events prompt'),
+}
+
+EVENT_DATA = {
+    'event_id': 'acme-launch', 'company_id': 'acme', 'occurred_on': '2024-05-01',
+    'event_type': 'product_release', 'title': 'Acme launches Widget',
+}
+
+
+class TestSplitLlmBundle:
+    """split_llm_bundle keeps only well-formed sections; the rest fall back to their own call."""
+
+    def test_non_dict_reply_gives_nothing(self):
+        assert split_llm_bundle(BUNDLE_SECTIONS, ['funding']) == {}
+        assert split_llm_bundle(BUNDLE_SECTIONS, None) == {}
+
+    def test_well_formed_sections_keep_their_context(self):
+        bundle = {
+            'funding': {'events': []},
+            'leadership': {'team_members': [{'name': 'Jane Doe'}]},
+            'products': [{'name': 'Widget'}],
+            'other_events': {'events': [EVENT_DATA]},
+        }
+        prefetched = split_llm_bundle(BUNDLE_SECTIONS, bundle)
+        assert prefetched['funding'] == ('funding ctx', {'events': []})
+        assert prefetched['leadership'] == ('leadership ctx', {'team_members': [{'name': 'Jane Doe'}]})
+        assert prefetched['products'] == ('products ctx', [{'name': 'Widget'}])
+        assert [e.title for e in prefetched['other_events']] == ['Acme launches Widget']
+
+    def test_malformed_or_missing_sections_are_left_out(self):
+        bundle = {
+            'funding': 'x',
+            'leadership': {'unexpected': []},
+            'other_events': {'events': [{'title': 'no date'}]},
+        }
+        assert split_llm_bundle(BUNDLE_SECTIONS, bundle) == {}
+
+    def test_funding_events_key_accepted(self):
+        prefetched = split_llm_bundle({'funding': BUNDLE_SECTIONS['funding']}, {'funding': {'funding_events': []}})
+        assert prefetched == {'funding': ('funding ctx', {'funding_events': []})}
+
+
+def make_event(title, round_name=None, occurred_on=date(2024, 1, 1), event_type='funding'):
+    return Event(event_id=title, company_id='acme', occurred_on=occurred_on,
+                 event_type=event_type, title=title, round_name=round_name)
+
+
+class TestDedupeEvents:
+    """dedupe_events drops near-duplicates and keeps the first of each."""
+
+    def test_drops_punctuation_and_case_variants(self):
+        events = [make_event('Series B', 'Series B'), make_event('series b!', 'SERIES B'),
+                  make_event('Series C', 'Series C')]
+        assert [e.event_id for e in dedupe_events(events)] == ['Series B', 'Series C']
+
+    def test_keeps_events_that_differ_in_date_or_type(self):
+        events = [make_event('Launch'), make_event('Launch', occurred_on=date(2024, 2, 1)),
+                  make_event('Launch', event_type='product_release')]
+        assert len(dedupe_events(events)) == 3
+
+    def test_empty_list(self):
+        assert dedupe_events([]) == []
+
+
+# ============================================================================
+# Per-thread log capture
+# ============================================================================
+
+class TestCompanyLogStdout:
+    """CompanyLogStdout.capture prints a call's output as one block."""
+
+    def test_capture_writes_output_after_the_call(self):
+        stream = io.StringIO()
+        log_stdout = CompanyLogStdout(stream)
+
+        def work(value):
+            log_stdout.write("first\n")
+            assert stream.getvalue() == ""
+            log_stdout.write("second\n")
+            return value * 2
+
+        assert log_stdout.capture(work, 21) == 42
+        assert stream.getvalue() == "first\nsecond\n"
+
+    def test_capture_flushes_output_then_reraises(self):
+        stream = io.StringIO()
+        log_stdout = CompanyLogStdout(stream)
+
+        def fail():
+            log_stdout.write("before failure\n")
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            log_stdout.capture(fail)
+        assert stream.getvalue() == "before failure\n"
+
+    def test_writes_outside_capture_go_straight_through(self):
+        stream = io.StringIO()
+        log_stdout = CompanyLogStdout(stream)
+        log_stdout.write("direct\n")
+        assert stream.getvalue() == "direct\n"
+
+    def test_nested_capture_restores_the_outer_buffer(self):
+        stream = io.StringIO()
+        log_stdout = CompanyLogStdout(stream)
+
+        def outer():
+            log_stdout.write("outer start\n")
+            log_stdout.capture(lambda: log_stdout.write("inner\n"))
+            log_stdout.write("outer end\n")
+
+        log_stdout.capture(outer)
+        assert stream.getvalue() == "outer start\ninner\nouter end\n"
+
+
+class TestRunSideBySide:
+    """run_side_by_side never swaps sys.stdout; it only uses an installed CompanyLogStdout."""
+
+    @staticmethod
+    def calls(log):
+        def section(name, delay):
+            import time
+            time.sleep(delay)
+            print(f"{name} done")
+            log.append(name)
+            return name
+        return [(section, ("a", 0.05)), (section, ("b", 0.0))]
+
+    def test_replays_logs_in_call_order_when_installed(self, monkeypatch):
+        stream = io.StringIO()
+        log_stdout = CompanyLogStdout(stream)
+        monkeypatch.setattr("sys.stdout", log_stdout)
+        finished = []
+        assert run_side_by_side(self.calls(finished)) == ["a", "b"]
+        import sys
+        assert sys.stdout is log_stdout
+        assert finished == ["b", "a"]
+        assert stream.getvalue() == "a done\nb done\n"
+
+    def test_leaves_plain_stdout_alone(self, monkeypatch):
+        stream = io.StringIO()
+        monkeypatch.setattr("sys.stdout", stream)
+        assert run_side_by_side(self.calls([])) == ["a", "b"]
+        import sys
+        assert sys.stdout is stream
+        assert sorted(stream.getvalue().splitlines()) == ["a done", "b done"]
+
+    def test_writes_every_log_before_reraising(self, monkeypatch):
+        stream = io.StringIO()
+        monkeypatch.setattr("sys.stdout", CompanyLogStdout(stream))
+
+        def fail():
+            print("failed section")
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_side_by_side([(fail, ()), (print, ("later section",))])
+        assert stream.getvalue() == "failed section\nlater section\n"
+
+
+class TestPendingLlmSections:
+    """pending_llm_sections checks only the cheap gates."""
+
+    def test_pre_extracted_sections_are_skipped(self):
+        sources = {'pre_extracted_entities': {'funding_events': [{}], 'products': []},
+                   'files': {'about': {}}}
+        assert pending_llm_sections(sources) == ['leadership', 'products', 'other_events']
+
+    def test_no_scraped_data_skips_other_events(self):
+        assert pending_llm_sections({}) == ['funding', 'leadership', 'products']